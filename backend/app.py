@@ -1,40 +1,75 @@
-import xmlrpc.client
-from flask import Flask, request, jsonify, abort
+from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+import websocket
 import os
+import sys
 import shutil
-import base64
-import json
 import time
+import itertools
+import zlib
+import gzip
+import errno
+import atexit
+import signal
 import threading
 import secrets
-from datetime import datetime
 from collections import deque
-import threading
-import time
-import secrets
-from functools import wraps
+from functools import wraps, lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+class OrjsonProvider(JSONProvider):
+    """Serialize request/response JSON with orjson instead of the stdlib encoder"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype="application/json")
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
-# Configuration
-# Use a local temporary directory for downloading to avoid FUSE issues
-TEMP_DOWNLOAD_DIR = "/content/temp_downloads"
-# Final destination on Google Drive
-FINAL_DIR = "/content/drive/MyDrive/TorrentDownloads"
-
 # --- Configuration ---
 # Use a local path for high-speed download (SSD), then move to Drive
-TEMP_DOWNLOAD_DIR = "/content/temp_downloads"
+# Overridable so the notebook can stage in tmpfs (/dev/shm) when downloads fit in RAM
+TEMP_DOWNLOAD_DIR = os.environ.get('TEMP_DOWNLOAD_DIR', "/content/temp_downloads")
 FINAL_DRIVE_DIR = "/content/drive/MyDrive/TorrentDownloads"
-ARIA2_RPC_URL = "http://localhost:6800/rpc"
+ARIA2_RPC_URL = "http://localhost:6800/jsonrpc"
+ARIA2_WS_URL = "ws://localhost:6800/jsonrpc"
 LOG_FILE = "/content/backend_logs.json"
-API_KEY = os.environ.get("CLOUDLEECHER_API_KEY")
+# Echo log lines only to an interactive terminal; under gunicorn or a redirect they are already persisted
+LOG_TO_CONSOLE = sys.stdout.isatty()
+
+# aria2 fields requested per call site
+STATUS_KEYS = ("gid", "status", "totalLength", "completedLength", "downloadSpeed", "uploadSpeed", "dir", "files", "errorMessage", "errorCode", "numSeeders", "connections", "infoHash", "bittorrent", "followedBy", "following")
+MONITOR_KEYS = ("gid", "status", "files", "totalLength")
+QUEUE_KEYS = ("gid", "status")
+GID_KEYS = ("gid",)
+
+# Fields shared by every fake aria2 task reported while moving to Drive
+UPLOADING_TASK_TEMPLATE = {
+    "status": "uploading", # Custom status
+    "downloadSpeed": "0",
+    "uploadSpeed": "0",
+    "dir": FINAL_DRIVE_DIR
+}
 
 # Ensure directories exist
 os.makedirs(TEMP_DOWNLOAD_DIR, exist_ok=True)
-os.makedirs(FINAL_DIR, exist_ok=True)
+os.makedirs(FINAL_DRIVE_DIR, exist_ok=True)
 
 # Authentication
 API_KEY = os.environ.get('CLOUDLEECHER_API_KEY')
@@ -44,34 +79,181 @@ if not API_KEY:
     print(f"\n{'='*50}\nGenerated API Key: {API_KEY}\n{'='*50}\n")
 else:
     print(f"\n{'='*50}\nUsing Configured API Key: {API_KEY}\n{'='*50}\n")
-
-# Create directories
-os.makedirs(TEMP_DOWNLOAD_DIR, exist_ok=True)
-# We don't create FINAL_DOWNLOAD_DIR here because Drive might not be mounted yet when this script starts,
-# although in the notebook flow it should be. We'll check it before moving.
-
-# API Security
-API_KEY = os.environ.get("CL_API_KEY") or secrets.token_urlsafe(12)
-
-# Ensure directories exist
-os.makedirs(TEMP_DOWNLOAD_DIR, exist_ok=True)
-os.makedirs(FINAL_DRIVE_DIR, exist_ok=True)
+API_KEY_BYTES = API_KEY.encode()
 
 # --- State Management ---
 # In-memory log storage (last 100 entries)
 logs = deque(maxlen=100)
+logs_lock = threading.Lock()
+# Bumped on every append so /api/logs can reuse its last serialized body
+logs_version = 0
+# Versions restart at 0 with each process, so their ETags carry a per-process prefix
+BOOT_ID = secrets.token_hex(4)
+logs_cache = {"version": -1, "body": b''}
 
 # Track tasks that are currently being moved to Drive
-# Format: gid -> { name: str, size: int, start_time: float }
+# Format: gid -> (name: str, size: str, start_time: float, copied: int)
+# Plain tuples keep the per-poll merge in get_status free of dict lookups
+# Copy-on-write: writers build a new dict under uploading_lock and rebind the name,
+# so readers just take the current reference without locking. Never mutate it in place.
 uploading_tasks = {}
 uploading_lock = threading.Lock()
 
+# disk_usage on the Drive FUSE mount is slow, so the serialized result is kept for 60s
+drive_info_cache = {"timestamp": 0, "body": None}
+
+# --- Log Persistence ---
+def read_tail(path, nbytes):
+    """Return the complete lines within the last nbytes of a file"""
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - nbytes))
+        lines = f.read().splitlines()
+    if size > nbytes and lines:
+        # The first line was cut by the seek
+        lines = lines[1:]
+    return lines
+
+class LogWriter(threading.Thread):
+    """Buffers log lines in memory and appends them to LOG_FILE in periodic batches"""
+    def __init__(self, path, flush_interval=1.0, max_buffer=4 * 1024, max_size=1024 * 1024):
+        super().__init__()
+        self.daemon = True
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.max_size = max_size
+        self.size = 0
+        self.buffer = bytearray()
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.fd = None
+
+    def submit(self, line, urgent=False):
+        with self.lock:
+            self.buffer += line
+            full = len(self.buffer) >= self.max_buffer
+        if urgent:
+            # Write through right away so the line survives a crash
+            self.flush()
+        elif full:
+            self.wakeup.set()
+
+    def run(self):
+        while True:
+            # Flush every interval, or early once the buffer fills up
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        with self.flush_lock:
+            with self.lock:
+                if not self.buffer:
+                    return
+                data = bytes(self.buffer)
+                self.buffer.clear()
+            self.write(data)
+
+    def write(self, buf):
+        try:
+            # Keep one O_APPEND fd open instead of reopening the file per entry
+            if self.fd is None:
+                self.fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                self.size = os.fstat(self.fd).st_size
+            view = memoryview(buf)
+            while view:
+                written = os.write(self.fd, view)
+                view = view[written:]
+                self.size += written
+            if self.size > self.max_size:
+                self.compact()
+        except OSError:
+            pass
+
+    def compact(self):
+        """Rewrite the file with only its newest half once it outgrows max_size"""
+        lines = read_tail(self.path, self.max_size // 2)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'wb') as f:
+            if lines:
+                f.write(b'\n'.join(lines) + b'\n')
+            # Make the new contents durable before the rename can expose them
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        # The old fd points at the replaced file; reopen on the next write
+        os.close(self.fd)
+        self.fd = None
+
+def load_recent_logs():
+    """Seed the in-memory log with the newest entries persisted by a previous run"""
+    try:
+        lines = read_tail(LOG_FILE, 64 * 1024)
+    except OSError:
+        return
+    for line in lines[-logs.maxlen:]:
+        try:
+            logs.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            pass
+
+load_recent_logs()
+log_writer = LogWriter(LOG_FILE)
+log_writer.start()
+atexit.register(log_writer.flush)
+
+# --- Aria2 RPC Client ---
+class Aria2Error(Exception):
+    """Error object returned by aria2 for a failed RPC call"""
+    def __init__(self, code, message):
+        super().__init__(f"{message} (code {code})")
+        self.code = code
+        self.message = message
+
+class Aria2Namespace:
+    """Exposes aria2.* / system.* methods as attributes, like xmlrpc's ServerProxy"""
+    def __init__(self, client, prefix):
+        self.client = client
+        self.prefix = prefix
+
+    def __getattr__(self, name):
+        return lambda *params: self.client.call(f"{self.prefix}.{name}", *params)
+
+class Aria2Client:
+    """JSON-RPC client for aria2 over a keep-alive HTTP session"""
+    def __init__(self, url):
+        self.url = url
+        # One keep-alive session per worker thread; requests.Session is not thread-safe
+        self.local = threading.local()
+        self.ids = itertools.count()
+        self.aria2 = Aria2Namespace(self, 'aria2')
+        self.system = Aria2Namespace(self, 'system')
+
+    @property
+    def session(self):
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            self.local.session = session
+        return session
+
+    def call(self, method, *params):
+        body = orjson.dumps({"jsonrpc": "2.0", "id": next(self.ids), "method": method, "params": list(params)})
+        response = self.session.post(self.url, data=body, headers={'Content-Type': 'application/json'}, timeout=30)
+        reply = orjson.loads(response.content)
+        if 'error' in reply:
+            raise Aria2Error(reply['error'].get('code'), reply['error'].get('message'))
+        return reply['result']
+
 # Connect to Aria2 RPC
 # Retry connection in case aria2 is slow to start
 s = None
 for i in range(5):
     try:
-        s = xmlrpc.client.ServerProxy(ARIA2_RPC_URL)
+        s = Aria2Client(ARIA2_RPC_URL)
         s.aria2.getVersion()
         print("Connected to Aria2 RPC")
         break
@@ -84,183 +266,378 @@ if not s:
 
 # --- Helpers ---
 
+# (second, "YYYY-MM-DDTHH:MM:SS") for the most recent log timestamp
+_timestamp_cache = (0, "")
+
+def iso_timestamp():
+    """Local ISO-8601 timestamp with microseconds, formatting the date part only once per second"""
+    global _timestamp_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _timestamp_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1e6):06d}"
+
 def log(level, operation, message, gid=None, extra=None):
     """Add entry to log with timestamp and details"""
     entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": iso_timestamp(),
         "level": level,  # info, warning, error
         "operation": operation,
         "message": message,
         "gid": gid,
         "extra": extra
     }
-    logs.append(entry)
-    
-    # Also write to file for persistence
+    global logs_version
+    with logs_lock:
+        last = logs[-1] if logs else None
+        if last and last["level"] == level and last["operation"] == operation and last["message"] == message \
+                and last["gid"] == gid and last["extra"] == extra:
+            # Repeat of the previous entry: bump its count instead of storing, persisting and printing it again
+            last["count"] = last.get("count", 1) + 1
+            last["timestamp"] = entry["timestamp"]
+            logs_version += 1
+            return
+        logs.append(entry)
+        logs_version += 1
+
+    # Hand off to the writer thread for persistence; warnings and errors are written immediately
     try:
-        with open(LOG_FILE, 'a') as f:
-            f.write(json.dumps(entry) + '\n')
+        log_writer.submit(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE), urgent=level != "info")
     except:
         pass
-    
+
     # Print to console
-    print(f"[{level.upper()}] {operation}: {message}" + (f" (GID: {gid})" if gid else ""))
+    if LOG_TO_CONSOLE:
+        sys.stdout.write(f"[{level.upper()}] {operation}: {message}" + (f" (GID: {gid})" if gid else "") + "\n")
+
+def multicall(*calls, strict=True):
+    """Run several (method, *params) aria2 calls in a single system.multicall round trip"""
+    payload = [{"methodName": method, "params": list(params)} for method, *params in calls]
+    results = []
+    for result in s.system.multicall(payload):
+        # Each entry is either a one-item list holding the return value, or an error object
+        if isinstance(result, dict):
+            error = Aria2Error(result.get('code'), result.get('message'))
+            if strict:
+                raise error
+            # Non-strict batches hand back per-call errors in place of results
+            results.append(error)
+            continue
+        results.append(result[0])
+    return results
+
+# Bodies smaller than this don't shrink enough to be worth gzipping
+GZIP_MIN_SIZE = 512
+
+@lru_cache(maxsize=8)
+def gzip_body(body):
+    """gzip a response body; cached bodies are served many times, so each is compressed once"""
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+def json_response(body, etag=None):
+    """Wrap already-serialized JSON bytes in a response, bypassing jsonify"""
+    # A bytes body gets its Content-Length set directly, with no re-encoding or iteration
+    compress = len(body) >= GZIP_MIN_SIZE and 'gzip' in request.accept_encodings
+    response = app.response_class(gzip_body(body) if compress else body, mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    if compress:
+        response.content_encoding = 'gzip'
+    if etag is not None:
+        # Answer a matching If-None-Match with an empty 304 instead of the body
+        response.set_etag(etag, weak=True)
+        response.make_conditional(request)
+    return response
+
+class StatusCache:
+    """Short-lived cache for aria2 tell* queries shared by concurrent request handlers"""
+    def __init__(self, ttl=0.5):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def get(self, *calls):
+        key = tuple((method, *(tuple(p) if isinstance(p, list) else p for p in params)) for method, *params in calls)
+        # Holding the lock across the RPC makes concurrent callers share one in-flight request
+        with self.lock:
+            hit = self.entries.get(key)
+            if hit and time.monotonic() - hit[0] < self.ttl:
+                return hit[1]
+            result = multicall(*calls)
+            self.entries[key] = (time.monotonic(), result)
+            return result
+
+    def invalidate(self):
+        with self.lock:
+            self.entries.clear()
+
+status_cache = StatusCache()
+
+def slim_task(task):
+    """Trim a task's bulky fields to what the frontend reads: the first file and the torrent name"""
+    files = task.get('files')
+    bt = task.get('bittorrent')
+    if (not files or len(files) == 1) and not bt:
+        return task
+    task = dict(task)
+    if files:
+        task['files'] = files[:1]
+    if bt:
+        # announceList alone can run to hundreds of tracker URLs
+        task['bittorrent'] = {"info": {"name": bt['info'].get('name')}} if 'info' in bt else {}
+    return task
+
+# Encoded /api/status body, reused while the aria2 snapshot and upload table are unchanged
+status_body_cache = {"snapshot": None, "uploading": None, "body": b'', "etag": ''}
+status_body_lock = threading.Lock()
+
+def remove_path(path):
+    """Delete a file or directory tree, using scandir's cached entry types instead of a stat per entry"""
+    try:
+        os.unlink(path)
+        return
+    except IsADirectoryError:
+        pass
+
+    # Walk with an explicit stack, unlinking files as we go; directories are
+    # collected parent-first and removed in reverse once they are empty.
+    stack = [path]
+    dirs = []
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    os.unlink(entry.path)
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+# ioctl(FICLONE) from linux/fs.h; exposed by the fcntl module only from Python 3.12
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+# Files copied to Drive in parallel per move; tune with COPY_WORKERS
+COPY_QUEUE_DEPTH = int(os.environ.get('COPY_WORKERS', 8))
+# One fallback buffer per copying thread, reused for every file that thread copies
+copy_buffers = threading.local()
+
+def copy_buffer():
+    view = getattr(copy_buffers, 'view', None)
+    if view is None:
+        view = copy_buffers.view = memoryview(bytearray(COPY_CHUNK_SIZE))
+    return view
+
+def copy_file(src, dst, progress=None):
+    """Clone a file's extents, or else copy its contents in-kernel in large chunks; progress gets each chunk's byte count"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        # On a reflink-capable filesystem (btrfs, xfs) share the extents instead of copying any bytes
+        if size and fcntl is not None:
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                if progress:
+                    progress(size)
+                return
+            except OSError:
+                # EXDEV across filesystems, EOPNOTSUPP/EINVAL where cloning isn't supported
+                pass
 
-def check_auth(f):
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+
+        offset = 0
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while offset < size:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK_SIZE, offset, offset)
+                    if copied == 0:
+                        break
+                    offset += copied
+                    if progress:
+                        progress(copied)
+            except OSError:
+                # EXDEV/ENOSYS/EINVAL on FUSE or older kernels; sendfile resumes from the same offset
+                pass
+
+        if hasattr(os, 'sendfile'):
+            # copy_file_range took explicit offsets and left the destination position at 0,
+            # while sendfile writes wherever that position is
+            fdst.seek(offset)
+            try:
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, COPY_CHUNK_SIZE)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    if progress:
+                        progress(sent)
+                return
+            except OSError:
+                # Not supported for this pair of files, finish with a plain copy
+                pass
+
+        fsrc.seek(offset)
+        fdst.seek(offset)
+        view = copy_buffer()
+        while True:
+            n = fsrc.readinto(view)
+            if not n:
+                break
+            fdst.write(view[:n])
+            if progress:
+                progress(n)
+
+def copy_tree(src, dst, progress=None):
+    """Recreate a directory tree under dst, then copy its files with several in flight at once"""
+    pairs = []
+    stack = [(src, dst)]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.mkdir(dst_dir)
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                target = os.path.join(dst_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, target))
+                else:
+                    pairs.append((entry.path, target))
+
+    if not pairs:
+        return
+    # Drive FUSE writes are latency-bound per file, so keep a queue of copies going
+    pool = ThreadPoolExecutor(max_workers=max(1, min(COPY_QUEUE_DEPTH, len(pairs))))
+    try:
+        futures = [pool.submit(copy_file, src_path, dst_path, progress) for src_path, dst_path in pairs]
+        for future in as_completed(futures):
+            # Re-raise the first failure; the move is abandoned, so don't start the queued copies
+            future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def move_path(src, dst, is_dir=None, progress=None):
+    """Move a file or directory, renaming when possible and copying across filesystems; progress gets each chunk's byte count"""
+    # Copying a tree into itself would recurse, and the source removal afterwards would delete both
+    src_abs = os.path.abspath(src)
+    if os.path.commonpath([src_abs, os.path.abspath(dst)]) == src_abs:
+        raise shutil.Error(f"Cannot move '{src}' into itself '{dst}'")
+    try:
+        os.rename(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    # Local SSD -> Drive FUSE: copy, then drop the source
+    if is_dir is None:
+        is_dir = os.path.isdir(src)
+    if is_dir:
+        copy_tree(src, dst, progress)
+    else:
+        copy_file(src, dst, progress)
+    remove_path(src)
+
+# --- Authentication Middleware ---
+def require_api_key(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         if request.method == 'OPTIONS':
             return f(*args, **kwargs)
 
         request_key = request.headers.get('x-api-key')
-        if not request_key or request_key != API_KEY:
+        # Compare as bytes in constant time; headers may carry non-ASCII text
+        if not request_key or not secrets.compare_digest(request_key.encode(), API_KEY_BYTES):
             log("warning", "auth", "Unauthorized access attempt")
             return jsonify({"error": "Unauthorized: Invalid or missing API Key"}), 401
         return f(*args, **kwargs)
     return decorated_function
 
-class BackgroundMonitor(threading.Thread):
-    def __init__(self):
-        super().__init__()
-        self.daemon = True
-        self.stopped = False
-
-    def run(self):
-        log("info", "monitor", "Background monitor started")
-        while not self.stopped:
-            try:
-                self.check_completed_downloads()
-            except Exception as e:
-                pass # Silent fail (e.g. aria2 not ready yet)
-            time.sleep(5)
-
-    def check_completed_downloads(self):
-        try:
-            # Get stopped tasks (includes complete, error, removed)
-            stopped = s.aria2.tellStopped(0, 100, ["gid", "status", "files", "bittorrent", "totalLength", "errorCode"])
-
-            for task in stopped:
-                status = task['status']
-                gid = task['gid']
-
-                if status == 'complete':
-                    self.handle_complete_task(task)
-                elif status == 'error':
-                     # Log error and remove
-                     err_code = task.get('errorCode', 'unknown')
-                     log("error", "download", f"Task failed with error code {err_code}", gid=gid)
-                     try: s.aria2.removeDownloadResult(gid)
-                     except: pass
-                elif status == 'removed':
-                     try: s.aria2.removeDownloadResult(gid)
-                     except: pass
-
-        except Exception as e:
-            pass
-
-    def handle_complete_task(self, task):
-        gid = task['gid']
-        files = task.get('files', [])
-
-        if not files:
-            try: s.aria2.removeDownloadResult(gid)
-            except: pass
-            return
-
-        # Try to find the root file or directory
-        bt_name = task.get('bittorrent', {}).get('info', {}).get('name')
-
-        source_path = None
-
-        # Strategy 1: Look for the name provided in metadata
-        if bt_name:
-             possible_path = os.path.join(TEMP_DOWNLOAD_DIR, bt_name)
-             if os.path.exists(possible_path):
-                 source_path = possible_path
-
-        # Strategy 2: Use the first file path
-        if not source_path and files:
-            first_file_path = files[0]['path']
-            # If the path starts with TEMP_DOWNLOAD_DIR, great
-            if os.path.exists(first_file_path):
-                # If it's a multi-file torrent, first_file_path is deep inside
-                # We want the top-level directory.
-                rel_path = os.path.relpath(first_file_path, TEMP_DOWNLOAD_DIR)
-                top_level = rel_path.split(os.sep)[0]
-                possible_path = os.path.join(TEMP_DOWNLOAD_DIR, top_level)
-                if os.path.exists(possible_path):
-                    source_path = possible_path
-
-        if not source_path:
-             log("error", "move", "Could not locate downloaded files", gid=gid)
-             # Don't remove result so we can debug? Or remove to avoid loop?
-             # Remove it to avoid infinite loop
-             try: s.aria2.removeDownloadResult(gid)
-             except: pass
-             return
-
-        dest_path = os.path.join(FINAL_DIR, os.path.basename(source_path))
-
-        # Handle collision
-        if os.path.exists(dest_path):
-            base, ext = os.path.splitext(os.path.basename(source_path))
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            dest_path = os.path.join(FINAL_DIR, f"{base}_{timestamp}{ext}")
-
-        log("info", "move", f"Moving {os.path.basename(source_path)} to Drive...", gid=gid)
-
-        try:
-            shutil.move(source_path, dest_path)
-            log("info", "move", f"Move successful: {os.path.basename(dest_path)}", gid=gid)
-            try: s.aria2.removeDownloadResult(gid)
-            except: pass
-        except Exception as e:
-            log("error", "move", f"Move failed: {str(e)}", gid=gid)
-            # If move failed (e.g. Drive full), we leave the task in 'stopped' state
-            # but 'tellStopped' returns it again.
-            # To avoid retry loop spam, we might need to blacklist it in memory
-            # or just log error.
-            # For now, we leave it.
-# --- Authentication Middleware ---
-@app.before_request
-def check_auth():
-    if request.method == 'OPTIONS':
-        return
-
-    # Allow health check without auth for initial connectivity test (optional, but stricter is better)
-    if request.endpoint == 'health':
-        return
-
-    # Check Header
-    key = request.headers.get('x-api-key')
-    if key != API_KEY:
-        # Also allow query param for convenience if needed, but header is preferred
-        return jsonify({"error": "Unauthorized"}), 401
-
 # --- Background Monitor ---
-class DownloadMonitor(threading.Thread):
+# Poll every MONITOR_POLL_SEC while downloads are running, backing off to MONITOR_POLL_MAX_SEC when idle
+MONITOR_INTERVAL = float(os.environ.get('MONITOR_POLL_SEC', 2))
+MONITOR_MAX_INTERVAL = float(os.environ.get('MONITOR_POLL_MAX_SEC', 60))
+# Completed downloads moved to Drive at the same time
+MOVE_WORKERS = 2
+
+class BackgroundMonitor(threading.Thread):
     def __init__(self):
         super().__init__()
         self.daemon = True
         self.running = True
+        self.interval = MONITOR_INTERVAL
+        self.wakeup = threading.Event()
+        # Moves run off the polling thread so a multi-GB copy doesn't stall completion checks
+        self.moves = ThreadPoolExecutor(max_workers=MOVE_WORKERS, thread_name_prefix='move')
 
     def run(self):
         log("info", "monitor", "Background monitor started")
         while self.running:
+            busy = True
             try:
-                self.check_downloads()
+                busy = self.check_downloads()
             except Exception as e:
                 log("error", "monitor", f"Monitor loop failed: {e}")
-            time.sleep(2)
+            # Back off exponentially while aria2 has nothing for us to watch
+            if busy:
+                self.interval = MONITOR_INTERVAL
+            else:
+                self.interval = min(self.interval * 2, MONITOR_MAX_INTERVAL)
+            self.wakeup.wait(self.interval)
+            self.wakeup.clear()
+
+    def poke(self):
+        """Check right away and drop back to fast polling, e.g. after a new download was queued"""
+        self.interval = MONITOR_INTERVAL
+        self.wakeup.set()
+
+    def stop(self):
+        """End the loop without waiting out the current interval"""
+        self.running = False
+        self.wakeup.set()
+        # Don't start queued moves on the way out; their results stay in aria2 and are
+        # picked up again on the next start. A move already copying is left to finish.
+        self.moves.shutdown(wait=False, cancel_futures=True)
 
     def check_downloads(self):
-        # 1. Get completed tasks from Aria2
+        """Move completed downloads to Drive; returns False when there is nothing to watch"""
+        global uploading_tasks
+        # 1. Get stopped tasks from Aria2 (cheap keys only), plus whether anything is still downloading
         try:
-            stopped = s.aria2.tellStopped(0, 100, ["gid", "status", "files", "totalLength"])
+            active, waiting, stopped = multicall(
+                ("aria2.tellActive", GID_KEYS),
+                ("aria2.tellWaiting", 0, 1, GID_KEYS),
+                ("aria2.tellStopped", 0, 100, QUEUE_KEYS),
+            )
         except Exception:
-            return
+            return False
+
+        busy = bool(active or waiting)
+        complete = [task['gid'] for task in stopped if task['status'] == 'complete']
+        if not complete:
+            return busy
+        busy = True
+
+        # 2. Fetch the heavy file lists only for completions we haven't started moving yet
+        uploading = uploading_tasks
+        new = [gid for gid in complete if gid not in uploading]
+        if not new:
+            return busy
+        try:
+            details = multicall(*[("aria2.tellStatus", gid, MONITOR_KEYS) for gid in new], strict=False)
+        except Exception:
+            return busy
 
-        for task in stopped:
+        unmovable = []
+        for task in details:
+            if isinstance(task, Aria2Error):
+                # Removed since the listing above
+                continue
             gid = task['gid']
             status = task['status']
 
@@ -284,24 +661,34 @@ class DownloadMonitor(threading.Thread):
                     # Assumption: aria2 downloads to TEMP_DOWNLOAD_DIR/TaskName or TEMP_DOWNLOAD_DIR/File
 
                     # Robust path finding:
-                    rel_path = os.path.relpath(source_path, TEMP_DOWNLOAD_DIR)
-                    root_name = rel_path.split(os.sep)[0]
+                    # Finished magnet metadata reports a relative "[METADATA]<hash>" path; relpath would
+                    # resolve it against the cwd, so only absolute paths inside the staging dir are moved
+                    rel_path = os.path.relpath(source_path, TEMP_DOWNLOAD_DIR) if os.path.isabs(source_path) else os.pardir
+                    parts = rel_path.split(os.sep)
+                    root_name = parts[0]
+                    if root_name in (os.curdir, os.pardir):
+                        unmovable.append(gid)
+                        continue
+                    # A file nested under the root means the download is a directory
+                    is_dir = len(parts) > 1
                     full_source_path = os.path.join(TEMP_DOWNLOAD_DIR, root_name)
 
-                    uploading_tasks[gid] = {
-                        "name": root_name,
-                        "size": task['totalLength'],
-                        "start_time": time.time()
-                    }
+                    uploading_tasks = {**uploading_tasks, gid: (root_name, str(task.get('totalLength', 0)), time.time(), 0)}
 
-                # Start upload in a separate thread to not block the monitor loop?
-                # Actually, moving might take time. Let's spawn a mover thread per task
-                # or just do it here if we want sequential safe moves.
-                # Sequential is safer for Colab I/O.
+                # The gid stays in uploading_tasks until the move finishes, so it is only queued once
+                self.moves.submit(self.move_to_drive, gid, full_source_path, root_name, is_dir)
 
-                self.move_to_drive(gid, full_source_path, root_name)
+        if unmovable:
+            # Nothing to copy to Drive (metadata-only results); drop them so they aren't re-checked every tick
+            log("info", "monitor", f"Clearing {len(unmovable)} finished task(s) with no files to move")
+            try:
+                multicall(*[("aria2.removeDownloadResult", gid) for gid in unmovable], strict=False)
+            except Exception:
+                pass
+        return busy
 
-    def move_to_drive(self, gid, source, name):
+    def move_to_drive(self, gid, source, name, is_dir):
+        global uploading_tasks
         log("info", "move", f"Starting move to Drive: {name}", gid=gid)
         dest = os.path.join(FINAL_DRIVE_DIR, name)
 
@@ -309,12 +696,16 @@ class DownloadMonitor(threading.Thread):
             # Check if destination exists
             if os.path.exists(dest):
                 log("warning", "move", f"Destination exists, renaming: {name}", gid=gid)
-                base, ext = os.path.splitext(name)
                 timestamp = int(time.time())
-                dest = os.path.join(FINAL_DRIVE_DIR, f"{base}_{timestamp}{ext}")
+                if is_dir:
+                    # Dots in a folder name are not an extension ("Show.S01.1080p")
+                    dest = os.path.join(FINAL_DRIVE_DIR, f"{name}_{timestamp}")
+                else:
+                    base, ext = os.path.splitext(name)
+                    dest = os.path.join(FINAL_DRIVE_DIR, f"{base}_{timestamp}{ext}")
 
             # Perform Move
-            shutil.move(source, dest)
+            move_path(source, dest, is_dir, progress=partial(self.report_copied, gid))
             log("info", "move", "Move completed successfully", gid=gid)
 
             # Clean up from Aria2
@@ -328,12 +719,82 @@ class DownloadMonitor(threading.Thread):
         finally:
             with uploading_lock:
                 if gid in uploading_tasks:
-                    del uploading_tasks[gid]
+                    uploading_tasks = {k: v for k, v in uploading_tasks.items() if k != gid}
+
+    def report_copied(self, gid, nbytes):
+        """Count bytes copied to Drive so the uploading task shows how far the move has got; called from copy threads"""
+        global uploading_tasks
+        with uploading_lock:
+            entry = uploading_tasks.get(gid)
+            if entry:
+                name, size, started, copied = entry
+                uploading_tasks = {**uploading_tasks, gid: (name, size, started, copied + nbytes)}
 
 # Start Monitor
-monitor = DownloadMonitor()
+monitor = BackgroundMonitor()
 monitor.start()
 
+def stop_monitor_on(signum):
+    """Stop the monitor before the exit handler already installed for signum (gunicorn's) runs"""
+    previous = signal.getsignal(signum)
+    # SIG_DFL kills the process outright, so no queued move can start anyway
+    if not callable(previous):
+        return
+
+    def handler(sig, frame):
+        monitor.stop()
+        previous(sig, frame)
+    signal.signal(signum, handler)
+
+# concurrent.futures joins the move pool before atexit handlers run, so stopping from
+# atexit would only happen after every queued move had finished. Hook the exit signals instead.
+if threading.current_thread() is threading.main_thread():
+    stop_monitor_on(signal.SIGTERM)
+    stop_monitor_on(signal.SIGINT)
+
+# --- aria2 Notifications ---
+NOTIFY_EVENTS = frozenset(("aria2.onDownloadComplete", "aria2.onBtDownloadComplete", "aria2.onDownloadError", "aria2.onDownloadStop"))
+NOTIFY_RETRY_INTERVAL = 5
+
+class Aria2Notifier(threading.Thread):
+    """Listens for aria2's WebSocket event pushes and wakes the monitor as soon as a download stops"""
+    def __init__(self, url, monitor):
+        super().__init__()
+        self.daemon = True
+        self.running = True
+        self.url = url
+        self.monitor = monitor
+
+    def run(self):
+        connected = False
+        while self.running:
+            try:
+                ws = websocket.create_connection(self.url)
+                try:
+                    if not connected:
+                        log("info", "notify", "Subscribed to aria2 download events")
+                        connected = True
+                    while self.running:
+                        self.handle(ws.recv())
+                finally:
+                    ws.close()
+            except Exception:
+                # The monitor's own polling covers any events missed while disconnected
+                pass
+            time.sleep(NOTIFY_RETRY_INTERVAL)
+
+    def handle(self, message):
+        try:
+            method = orjson.loads(message).get('method')
+        except Exception:
+            return
+        if method in NOTIFY_EVENTS:
+            status_cache.invalidate()
+            self.monitor.poke()
+
+notifier = Aria2Notifier(ARIA2_WS_URL, monitor)
+notifier.start()
+
 # --- Routes ---
 
 @app.route('/health', methods=['GET'])
@@ -345,18 +806,15 @@ def health():
     })
 
 @app.route('/api/logs', methods=['GET'])
-@check_auth
-def get_logs():
-    try:
-        return jsonify({"logs": list(logs)})
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
-
-@app.route('/api/download/magnet', methods=['POST'])
-@check_auth
 @require_api_key
 def get_logs():
-    return jsonify({"logs": list(logs)})
+    with logs_lock:
+        if logs_cache["version"] != logs_version:
+            logs_cache["body"] = orjson.dumps({"logs": list(logs)})
+            logs_cache["version"] = logs_version
+        body = logs_cache["body"]
+        version = logs_cache["version"]
+    return json_response(body, etag=f"{BOOT_ID}-{version}")
 
 @app.route('/api/download/magnet', methods=['POST'])
 @require_api_key
@@ -365,18 +823,22 @@ def add_magnet():
     magnet_link = data.get('magnet')
     if not magnet_link:
         return jsonify({"error": "Magnet link is required"}), 400
-    
-    active = s.aria2.tellActive(["gid", "status"])
-    waiting = s.aria2.tellWaiting(0, 100, ["gid", "status"])
-    
+
+    active, waiting = status_cache.get(
+        ("aria2.tellActive", QUEUE_KEYS),
+        ("aria2.tellWaiting", 0, 100, QUEUE_KEYS),
+    )
+
     if len(active) > 0 or len(waiting) > 0:
         log("warning", "add_magnet", f"Rejected: {len(active)} active, {len(waiting)} waiting tasks already exist")
         return jsonify({"error": "Another download is already in progress. Please wait for it to complete."}), 429
-    
+
     try:
-        # Note: DOWNLOAD_DIR is set in aria2c startup args, but addUri inherits it.
+        # Note: TEMP_DOWNLOAD_DIR is set in aria2c startup args, but addUri inherits it.
         # We don't need to specify dir here unless we want to override.
         gid = s.aria2.addUri([magnet_link])
+        status_cache.invalidate()
+        monitor.poke()
         log("info", "add_magnet", "Magnet link added", gid=gid)
         return jsonify({"status": "success", "gid": gid})
     except Exception as e:
@@ -384,194 +846,180 @@ def add_magnet():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/download/file', methods=['POST'])
-@check_auth
-def add_torrent_file():
-    try:
-        data = request.json
-        b64_content = data.get('torrent')
-        if not b64_content:
-            log("error", "add_torrent_file", "Torrent file content is required")
-            return jsonify({"error": "Torrent file content is required"}), 400
-
-        active = s.aria2.tellActive(["gid", "status"])
-        waiting = s.aria2.tellWaiting(0, 100, ["gid", "status"])
-        
-        if len(active) > 0 or len(waiting) > 0:
-            log("warning", "add_torrent_file", f"Rejected: {len(active)} active, {len(waiting)} waiting tasks already exist")
-            return jsonify({"error": "Another download is already in progress. Please wait for it to complete."}), 429
 @require_api_key
 def add_torrent_file():
     data = request.json
     b64_content = data.get('torrent')
     if not b64_content:
-        return jsonify({"error": "Torrent content required"}), 400
+        log("error", "add_torrent_file", "Torrent file content is required")
+        return jsonify({"error": "Torrent file content is required"}), 400
+
+    active, waiting = status_cache.get(
+        ("aria2.tellActive", QUEUE_KEYS),
+        ("aria2.tellWaiting", 0, 100, QUEUE_KEYS),
+    )
+
+    if len(active) > 0 or len(waiting) > 0:
+        log("warning", "add_torrent_file", f"Rejected: {len(active)} active, {len(waiting)} waiting tasks already exist")
+        return jsonify({"error": "Another download is already in progress. Please wait for it to complete."}), 429
 
     try:
-        raw_bytes = base64.b64decode(b64_content)
-        binary_torrent = xmlrpc.client.Binary(raw_bytes)
-        gid = s.aria2.addTorrent(binary_torrent)
+        # JSON-RPC takes the torrent as base64 text, so the upload is passed through as-is
+        gid = s.aria2.addTorrent(b64_content)
+        status_cache.invalidate()
+        monitor.poke()
         log("info", "add_torrent_file", "Torrent file added successfully, downloading metadata...", gid=gid)
-        
+
         try:
-            status = s.aria2.tellStatus(gid, ["gid", "status", "files", "bittorrent"])
+            # Skip "files": for a large torrent it dwarfs the name we are after
+            status = s.aria2.tellStatus(gid, ["status", "bittorrent"])
             torrent_name = status.get('bittorrent', {}).get('info', {}).get('name', 'Unknown')
             log("info", "add_torrent_file", f"Torrent name: {torrent_name}", gid=gid, extra={"status": status.get('status')})
         except:
             pass
-        
-        log("info", "add_torrent_file", "Torrent file added", gid=gid)
+
         return jsonify({"status": "success", "gid": gid})
     except Exception as e:
         log("error", "add_torrent_file", str(e))
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/status', methods=['GET'])
-@check_auth
-def get_status():
-    try:
-        basic_keys = ["gid", "status", "totalLength", "completedLength", "downloadSpeed", "uploadSpeed", "dir", "files", "errorMessage", "errorCode", "followedBy", "following"]
-        extended_keys = basic_keys + ["numSeeders", "connections", "infoHash", "bittorrent"]
 @require_api_key
 def get_status():
     try:
-        # Standard Aria2 Status
-        keys = ["gid", "status", "totalLength", "completedLength", "downloadSpeed", "uploadSpeed", "dir", "files", "errorMessage", "errorCode", "numSeeders", "connections", "infoHash", "bittorrent", "followedBy", "following"]
-        
-        active = s.aria2.tellActive(keys)
-        waiting = s.aria2.tellWaiting(0, 100, keys)
-        stopped = s.aria2.tellStopped(0, 100, keys)
-        
-        # Inject Uploading Tasks
-        # We present them as "active" but with a custom status in the frontend if possible,
-        # or we return a separate list. Returning a separate list is cleaner, but frontend expects specific structure.
-        # Let's inject them into 'active' with a special status 'uploading'
-        
-        with uploading_lock:
-            for gid, info in uploading_tasks.items():
-                # Fake an aria2 task object
-                upload_task = {
-                    "gid": gid,
-                    "status": "uploading", # Custom status
-                    "totalLength": str(info['size']),
-                    "completedLength": str(info['size']), # It's done downloading
-                    "downloadSpeed": "0",
-                    "uploadSpeed": "0",
-                    "files": [{"path": info['name']}],
-                    "dir": FINAL_DRIVE_DIR
-                }
-                # Filter out the stopped task from aria2 if it's still there
-                stopped = [t for t in stopped if t['gid'] != gid]
-                active.append(upload_task)
-
-        return jsonify({
-            "active": active,
-            "waiting": waiting,
-            "stopped": stopped
-        })
+        snapshot = status_cache.get(
+            ("aria2.tellActive", STATUS_KEYS),
+            ("aria2.tellWaiting", 0, 100, STATUS_KEYS),
+            ("aria2.tellStopped", 0, 100, STATUS_KEYS),
+        )
+        uploading = uploading_tasks
+
+        with status_body_lock:
+            # Polls inside the cache TTL see the same snapshot object, so skip re-encoding it
+            if snapshot is status_body_cache["snapshot"] and uploading is status_body_cache["uploading"]:
+                return json_response(status_body_cache["body"], etag=status_body_cache["etag"])
+
+            active, waiting, stopped = ([slim_task(t) for t in tasks] for tasks in snapshot)
+            # Inject Uploading Tasks
+            # We present them as "active" with a special status 'uploading',
+            # since the frontend expects the active/waiting/stopped structure.
+            if uploading:
+                upload_tasks = [dict(
+                    UPLOADING_TASK_TEMPLATE,
+                    gid=gid,
+                    totalLength=size,
+                    completedLength=str(copied), # Bytes copied to Drive so far
+                    files=[{"path": name}]
+                ) for gid, (name, size, _, copied) in uploading.items()]
+                # Filter the stopped tasks still reported by aria2 in one pass
+                stopped = [t for t in stopped if t['gid'] not in uploading]
+                active = active + upload_tasks
+
+            body = orjson.dumps({
+                "active": active,
+                "waiting": waiting,
+                "stopped": stopped
+            })
+            # Tag by content: a new snapshot with the same tasks and progress still matches
+            etag = format(zlib.crc32(body), '08x')
+            status_body_cache.update(snapshot=snapshot, uploading=uploading, body=body, etag=etag)
+        return json_response(body, etag=etag)
     except Exception as e:
         log("error", "get_status", str(e))
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/control/pause', methods=['POST'])
-@check_auth
 @require_api_key
 def pause_download():
     gid = request.json.get('gid')
     try:
         s.aria2.pause(gid)
+        status_cache.invalidate()
         return jsonify({"status": "paused", "gid": gid})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/control/resume', methods=['POST'])
-@check_auth
 @require_api_key
 def resume_download():
     gid = request.json.get('gid')
     try:
         s.aria2.unpause(gid)
+        status_cache.invalidate()
+        monitor.poke()
         return jsonify({"status": "resumed", "gid": gid})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/control/remove', methods=['POST'])
-@check_auth
 @require_api_key
 def remove_download():
     gid = request.json.get('gid')
     try:
         s.aria2.forceRemove(gid)
+        status_cache.invalidate()
+        monitor.poke()
         return jsonify({"status": "removed", "gid": gid})
-    except xmlrpc.client.Fault as e:
+    except Aria2Error as e:
         if 'not found' in str(e).lower():
-            log("info", "remove_download", "GID not found (already removed)", gid=request.json.get('gid'))
-            return jsonify({"status": "removed", "gid": request.json.get('gid')})
+            log("info", "remove_download", "GID not found (already removed)", gid=gid)
+            return jsonify({"status": "removed", "gid": gid})
         else:
-            log("error", "remove_download", f"Aria2 error: {str(e)}", gid=request.json.get('gid'))
+            log("error", "remove_download", f"Aria2 error: {str(e)}", gid=gid)
             return jsonify({"error": str(e)}), 500
     except Exception as e:
         # If not found, it's fine
         return jsonify({"status": "removed", "gid": gid})
 
 @app.route('/api/drive/info', methods=['GET'])
-@check_auth
-def drive_info():
-    try:
-        total, used, free = shutil.disk_usage(FINAL_DIR)
 @require_api_key
 def drive_info():
-    try:
-        # Check Final Drive Destination
-        total, used, free = shutil.disk_usage(FINAL_DRIVE_DIR)
-        return jsonify({
+    now = time.time()
+    if drive_info_cache["body"] is None or now - drive_info_cache["timestamp"] > 60:
+        try:
+            # Check Final Drive Destination
+            total, used, free = shutil.disk_usage(FINAL_DRIVE_DIR)
+        except Exception:
+            return jsonify({"total": 0, "used": 0, "free": 0})
+        drive_info_cache["body"] = orjson.dumps({
             "total": total,
             "used": used,
             "free": free
         })
-    except Exception:
-        return jsonify({"total": 0, "used": 0, "free": 0})
+        drive_info_cache["timestamp"] = now
+    return json_response(drive_info_cache["body"])
 
 @app.route('/api/cleanup', methods=['POST'])
-@check_auth
 @require_api_key
 def cleanup_all():
     try:
-        active = s.aria2.tellActive(["gid"])
-        waiting = s.aria2.tellWaiting(0, 9999, ["gid"])
-        stopped = s.aria2.tellStopped(0, 9999, ["gid"])
-        
-        removed_count = 0
-        
-        for task in active + waiting:
-            try:
-                s.aria2.forceRemove(task['gid'])
-                removed_count += 1
-            except:
-                pass
-        
-        try:
-            s.aria2.purgeDownloadResult()
+        active, waiting, stopped = multicall(
+            ("aria2.tellActive", GID_KEYS),
+            ("aria2.tellWaiting", 0, 9999, GID_KEYS),
+            ("aria2.tellStopped", 0, 9999, GID_KEYS),
+        )
+
+        # Remove every task and purge results in one round trip; individual failures are skipped
+        results = multicall(
+            *[("aria2.forceRemove", task['gid']) for task in active + waiting],
+            ("aria2.purgeDownloadResult",),
+            strict=False,
+        )
+        removed_count = sum(not isinstance(result, Aria2Error) for result in results[:-1])
+        if not isinstance(results[-1], Aria2Error):
             removed_count += len(stopped)
-        except:
-            pass
-        
+
+        status_cache.invalidate()
+        monitor.poke()
         log("info", "cleanup_all", f"Cleaned up {removed_count} tasks")
         return jsonify({"status": "success", "removed": removed_count})
-        s.aria2.purgeDownloadResult()
-        # Also clear uploading tasks?
-        return jsonify({"status": "success"})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 if __name__ == "__main__":
-    log("info", "startup", "CloudLeecher Backend starting...")
-    
-    # Start background monitor
-    monitor = BackgroundMonitor()
-    monitor.start()
-    
+    log("info", "startup", "CloudLeecher Backend starting with API Key protection")
+
     print(f"\n{'='*50}")
     print(f"🔑 API KEY: {API_KEY}")
     print(f"{'='*50}\n")
-    log("info", "startup", f"Backend starting with API Key protection")
     app.run(port=5000)
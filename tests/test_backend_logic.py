@@ -2,16 +2,24 @@ import sys
 import os
 import unittest
 import time
-from unittest.mock import MagicMock, patch
+import tempfile
+import errno
+import subprocess
+import textwrap
+from unittest.mock import MagicMock, patch, ANY
 
 # Mock env vars
 os.environ["CLOUDLEECHER_API_KEY"] = "test-key"
 
-# We need to mock xmlrpc.client BEFORE importing app because it initializes the connection at module level
-patcher = patch('xmlrpc.client.ServerProxy')
-mock_proxy_class = patcher.start()
+# We need to mock the RPC session BEFORE importing app because it initializes the connection at module level
+patcher = patch('requests.Session')
+mock_session_class = patcher.start()
+mock_session_class.return_value.post.return_value.content = b'{"jsonrpc": "2.0", "id": 0, "result": {"version": "test"}}'
 mock_aria2 = MagicMock()
-mock_proxy_class.return_value.aria2 = mock_aria2
+
+def dispatch_multicall(calls):
+    # Answer system.multicall batches from the individual aria2 mocks
+    return [[getattr(mock_aria2, c['methodName'].split('.', 1)[1])(*c['params'])] for c in calls]
 
 # Also mock os.makedirs to avoid permission errors
 patcher_makedirs = patch('os.makedirs')
@@ -22,10 +30,11 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'b
 
 # Import app
 import app as backend_module
-from app import app as flask_app, BackgroundMover, DOWNLOAD_DIR, FINAL_DIR
+from app import app as flask_app, BackgroundMonitor, TEMP_DOWNLOAD_DIR as DOWNLOAD_DIR, FINAL_DRIVE_DIR as FINAL_DIR
 
-# Stop the real background thread that started on import
-backend_module.mover_thread.running = False
+# Stop the real background threads that started on import
+backend_module.monitor.stop()
+backend_module.notifier.running = False
 
 class TestBackend(unittest.TestCase):
     def setUp(self):
@@ -37,6 +46,9 @@ class TestBackend(unittest.TestCase):
 
         # Ensure we use the mocked aria2 from the module
         backend_module.s.aria2 = mock_aria2
+        backend_module.s.system = MagicMock()
+        backend_module.s.system.multicall.side_effect = dispatch_multicall
+        backend_module.status_cache.invalidate()
 
     def test_auth_required(self):
         # Test without key
@@ -47,6 +59,9 @@ class TestBackend(unittest.TestCase):
         response = self.client.get('/api/status', headers={'x-api-key': 'wrong'})
         self.assertEqual(response.status_code, 401)
 
+        response = self.client.get('/api/status', headers={'x-api-key': 'tést-key'})
+        self.assertEqual(response.status_code, 401)
+
         # Test with correct key
         # Mock return values to avoid AttributeError when accessing results
         mock_aria2.tellActive.return_value = []
@@ -55,13 +70,14 @@ class TestBackend(unittest.TestCase):
 
         response = self.client.get('/api/status', headers={'x-api-key': 'test-key'})
         self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"active": [], "waiting": [], "stopped": []})
 
-    @patch('shutil.move')
+    @patch('app.move_path')
     @patch('os.path.exists')
     @patch('os.path.relpath')
     def test_background_mover(self, mock_relpath, mock_exists, mock_move):
         # Create instance but don't start thread
-        mover = BackgroundMover()
+        mover = BackgroundMonitor()
 
         # Mock aria2.tellStopped to return a completed task
         # Task that downloaded /content/temp_downloads/MyMovie/movie.mkv
@@ -71,6 +87,7 @@ class TestBackend(unittest.TestCase):
             'files': [{'path': f'{DOWNLOAD_DIR}/MyMovie/movie.mkv'}]
         }
         mock_aria2.tellStopped.return_value = [task]
+        mock_aria2.tellStatus.return_value = task
 
         # Mock file system checks
         # We need to ensure os.path.exists returns True for source, but False for destination
@@ -84,24 +101,25 @@ class TestBackend(unittest.TestCase):
         # app.py: rel_path = os.path.relpath(source_path, DOWNLOAD_DIR)
         mock_relpath.return_value = 'MyMovie/movie.mkv'
 
-        # Execute check
-        mover.check_and_move_files()
+        # Execute check and wait for the queued move
+        mover.check_downloads()
+        mover.moves.shutdown(wait=True)
 
         # Verify move called
         # Should move DOWNLOAD_DIR/MyMovie to FINAL_DIR/MyMovie
         expected_src = os.path.join(DOWNLOAD_DIR, 'MyMovie')
         expected_dst = os.path.join(FINAL_DIR, 'MyMovie')
 
-        mock_move.assert_called_with(expected_src, expected_dst)
+        mock_move.assert_called_with(expected_src, expected_dst, True, progress=ANY)
 
         # Verify cleanup called
         mock_aria2.removeDownloadResult.assert_called_with('gid1')
 
-    @patch('shutil.move')
+    @patch('app.move_path')
     @patch('os.path.exists')
     @patch('os.path.relpath')
     def test_background_mover_collision(self, mock_relpath, mock_exists, mock_move):
-        mover = BackgroundMover()
+        mover = BackgroundMonitor()
 
         task = {
             'gid': 'gid2',
@@ -109,6 +127,7 @@ class TestBackend(unittest.TestCase):
             'files': [{'path': f'{DOWNLOAD_DIR}/MyMovie/movie.mkv'}]
         }
         mock_aria2.tellStopped.return_value = [task]
+        mock_aria2.tellStatus.return_value = task
 
         mock_relpath.return_value = 'MyMovie/movie.mkv'
 
@@ -118,15 +137,472 @@ class TestBackend(unittest.TestCase):
 
         mock_exists.side_effect = exists_side_effect
 
-        mover.check_and_move_files()
+        mover.check_downloads()
+        mover.moves.shutdown(wait=True)
 
         # Should detect collision and rename
         args, _ = mock_move.call_args
-        src, dst = args
+        src, dst, is_dir = args
 
         self.assertEqual(src, os.path.join(DOWNLOAD_DIR, 'MyMovie'))
         self.assertTrue('MyMovie_' in dst)
         self.assertNotEqual(dst, os.path.join(FINAL_DIR, 'MyMovie'))
+        self.assertTrue(is_dir)
+
+    @patch('app.move_path')
+    @patch('os.path.exists', return_value=True)
+    def test_collision_keeps_dotted_folder_names_intact(self, mock_exists, mock_move):
+        mover = BackgroundMonitor()
+        mover.move_to_drive('gid3', os.path.join(DOWNLOAD_DIR, 'Show.S01.1080p'), 'Show.S01.1080p', True)
+        mover.move_to_drive('gid4', os.path.join(DOWNLOAD_DIR, 'movie.mkv'), 'movie.mkv', False)
+
+        folder_dst = os.path.basename(mock_move.call_args_list[0].args[1])
+        file_dst = os.path.basename(mock_move.call_args_list[1].args[1])
+        self.assertRegex(folder_dst, r'^Show\.S01\.1080p_\d+$')
+        self.assertRegex(file_dst, r'^movie_\d+\.mkv$')
+
+    @patch('os.path.exists', return_value=False)
+    def test_monitor_does_not_block_on_moves(self, mock_exists):
+        mover = BackgroundMonitor()
+        mock_aria2.tellActive.return_value = []
+        mock_aria2.tellWaiting.return_value = []
+        mock_aria2.tellStopped.return_value = [{'gid': 'slow', 'status': 'complete'}]
+        mock_aria2.tellStatus.return_value = {
+            'gid': 'slow',
+            'status': 'complete',
+            'files': [{'path': f'{DOWNLOAD_DIR}/Big/big.mkv'}]
+        }
+
+        release = backend_module.threading.Event()
+        with patch('app.move_path', side_effect=lambda src, dst, is_dir, progress: release.wait(5)) as mock_move:
+            mover.check_downloads()
+            # Still moving: a second check must not queue it again
+            mover.check_downloads()
+            release.set()
+            mover.moves.shutdown(wait=True)
+
+        self.assertEqual(mock_move.call_count, 1)
+        # File lists are only fetched for the completion that wasn't being moved yet
+        self.assertEqual(mock_aria2.tellStatus.call_count, 1)
+        mock_aria2.tellStopped.assert_called_with(0, 100, backend_module.QUEUE_KEYS)
+        self.assertNotIn('slow', backend_module.uploading_tasks)
+
+    def test_monitor_reports_idle(self):
+        mock_aria2.tellActive.return_value = []
+        mock_aria2.tellWaiting.return_value = []
+        mock_aria2.tellStopped.return_value = []
+        self.assertFalse(BackgroundMonitor().check_downloads())
+
+        mock_aria2.tellActive.return_value = [{'gid': 'a'}]
+        self.assertTrue(BackgroundMonitor().check_downloads())
+
+    def test_monitor_stop_does_not_wait_out_interval(self):
+        mover = BackgroundMonitor()
+        with patch.object(mover, 'check_downloads', return_value=False):
+            mover.start()
+            mover.stop()
+            mover.join(1)
+        self.assertFalse(mover.is_alive())
+
+    def test_exit_signal_cancels_queued_moves(self):
+        # Run a real interpreter exit: the move pool is joined before atexit handlers,
+        # so only the signal hook can cancel queued moves in time
+        script = textwrap.dedent("""
+            import os, sys, signal, threading, time
+            from unittest.mock import patch
+            # gunicorn installs its exit handler before importing the app
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+            patch('os.makedirs').start()
+            session = patch('requests.Session').start()
+            session.return_value.post.return_value.content = b'{"jsonrpc": "2.0", "id": 0, "result": {"version": "test"}}'
+            sys.path.insert(0, sys.argv[1])
+            import app
+            app.notifier.running = False
+            started = threading.Event()
+            def move(n):
+                started.set()
+                time.sleep(0.2)
+                print("moved", n, flush=True)
+            for n in range(6):
+                app.monitor.moves.submit(move, n)
+            started.wait()
+            os.kill(os.getpid(), signal.SIGTERM)
+            time.sleep(10)
+        """)
+        backend_dir = os.path.join(os.path.dirname(__file__), '..', 'backend')
+        result = subprocess.run([sys.executable, '-c', script, backend_dir], capture_output=True, text=True, timeout=30,
+                                env=dict(os.environ, CLOUDLEECHER_API_KEY='test-key'))
+        moved = [line for line in result.stdout.splitlines() if line.startswith('moved')]
+        # Moves already copying finish; the queued ones never start
+        self.assertTrue(moved)
+        self.assertLessEqual(len(moved), backend_module.MOVE_WORKERS)
+
+    def test_notifier_wakes_monitor_on_completion(self):
+        monitor = MagicMock()
+        notifier = backend_module.Aria2Notifier('ws://aria2/jsonrpc', monitor)
+
+        notifier.handle(b'{"jsonrpc": "2.0", "method": "aria2.onDownloadStart", "params": [{"gid": "1"}]}')
+        notifier.handle(b'not json')
+        monitor.poke.assert_not_called()
+
+        notifier.handle(b'{"jsonrpc": "2.0", "method": "aria2.onDownloadComplete", "params": [{"gid": "1"}]}')
+        monitor.poke.assert_called_once_with()
+
+    def test_status_cache_shares_recent_result(self):
+        mock_aria2.tellActive.return_value = [{'gid': 'a'}]
+
+        cache = backend_module.StatusCache(ttl=60)
+        call = ("aria2.tellActive", ["gid"])
+        self.assertEqual(cache.get(call), [[{'gid': 'a'}]])
+        self.assertEqual(cache.get(call), [[{'gid': 'a'}]])
+        self.assertEqual(mock_aria2.tellActive.call_count, 1)
+
+        cache.invalidate()
+        cache.get(call)
+        self.assertEqual(mock_aria2.tellActive.call_count, 2)
+
+    def test_multicall_unwraps_results(self):
+        mock_aria2.tellActive.return_value = [{'gid': 'a'}]
+        mock_aria2.tellWaiting.return_value = []
+
+        active, waiting = backend_module.multicall(("aria2.tellActive", ["gid"]), ("aria2.tellWaiting", 0, 100, ["gid"]))
+        self.assertEqual(active, [{'gid': 'a'}])
+        self.assertEqual(waiting, [])
+        mock_aria2.tellWaiting.assert_called_with(0, 100, ["gid"])
+
+    def test_cleanup_batches_removals(self):
+        mock_aria2.tellActive.return_value = [{'gid': 'a'}]
+        mock_aria2.tellWaiting.return_value = [{'gid': 'b'}]
+        mock_aria2.tellStopped.return_value = [{'gid': 'c'}]
+        mock_aria2.forceRemove.side_effect = ['a', None]
+
+        def dispatch_with_errors(calls):
+            results = []
+            for c in calls:
+                result = getattr(mock_aria2, c['methodName'].split('.', 1)[1])(*c['params'])
+                if result is None:
+                    results.append({'code': 1, 'message': 'GID is not found'})
+                else:
+                    results.append([result])
+            return results
+        backend_module.s.system.multicall.side_effect = dispatch_with_errors
+
+        response = self.client.post('/api/cleanup', headers={'x-api-key': 'test-key'})
+        self.assertEqual(response.get_json(), {"status": "success", "removed": 2})
+        # One batch to list tasks, one to remove them
+        self.assertEqual(backend_module.s.system.multicall.call_count, 2)
+        mock_aria2.purgeDownloadResult.assert_called_once_with()
+
+    def test_aria2_client_raises_rpc_error(self):
+        client = backend_module.Aria2Client('http://aria2/jsonrpc')
+        client.local.session = MagicMock()
+        client.session.post.return_value.content = b'{"jsonrpc": "2.0", "id": 0, "error": {"code": 1, "message": "GID 1 is not found"}}'
+
+        with self.assertRaises(backend_module.Aria2Error) as ctx:
+            client.aria2.forceRemove('1')
+        self.assertEqual(ctx.exception.code, 1)
+
+        body = backend_module.orjson.loads(client.session.post.call_args.kwargs['data'])
+        self.assertEqual(body['method'], 'aria2.forceRemove')
+        self.assertEqual(body['params'], ['1'])
+
+    def test_logs_endpoint_reflects_new_entries(self):
+        headers = {'x-api-key': 'test-key'}
+        backend_module.log("info", "test", "first")
+        first = self.client.get('/api/logs', headers=headers).get_json()['logs']
+        self.assertEqual(first[-1]['message'], 'first')
+
+        backend_module.log("info", "test", "second")
+        second = self.client.get('/api/logs', headers=headers).get_json()['logs']
+        self.assertEqual(second[-1]['message'], 'second')
+
+    def test_log_coalesces_repeated_entries(self):
+        backend_module.log("warning", "test", "disk slow")
+        backend_module.log("warning", "test", "disk slow")
+        backend_module.log("warning", "test", "disk slow")
+
+        logs = self.client.get('/api/logs', headers={'x-api-key': 'test-key'}).get_json()['logs']
+        self.assertEqual(logs[-1]['message'], 'disk slow')
+        self.assertEqual(logs[-1]['count'], 3)
+        self.assertNotEqual(logs[-2].get('message'), 'disk slow')
+
+    def test_status_reports_uploading_tasks(self):
+        mock_aria2.tellActive.return_value = []
+        mock_aria2.tellWaiting.return_value = []
+        mock_aria2.tellStopped.return_value = [{'gid': 'up1', 'status': 'complete'}, {'gid': 'done', 'status': 'complete'}]
+
+        headers = {'x-api-key': 'test-key'}
+        before = self.client.get('/api/status', headers=headers).get_json()
+        # Published copy-on-write, so a new dict is swapped in rather than mutated
+        backend_module.uploading_tasks = {'up1': ("MyMovie", "10", 0, 4)}
+        try:
+            data = self.client.get('/api/status', headers=headers).get_json()
+        finally:
+            backend_module.uploading_tasks = {}
+
+        self.assertEqual([t['gid'] for t in data['active']], ['up1'])
+        self.assertEqual(data['active'][0]['status'], 'uploading')
+        self.assertEqual(data['active'][0]['totalLength'], '10')
+        self.assertEqual(data['active'][0]['completedLength'], '4')
+        self.assertEqual([t['gid'] for t in data['stopped']], ['done'])
+        self.assertEqual([t['gid'] for t in before['stopped']], ['up1', 'done'])
+
+    def test_status_trims_bulky_task_fields(self):
+        mock_aria2.tellActive.return_value = [{
+            'gid': 'a',
+            'files': [{'path': '/x/Show/e01.mkv'}, {'path': '/x/Show/e02.mkv'}],
+            'bittorrent': {'announceList': [['udp://t1'], ['udp://t2']], 'info': {'name': 'Show'}},
+        }]
+        mock_aria2.tellWaiting.return_value = [{'gid': 'm', 'bittorrent': {'announceList': []}}]
+        mock_aria2.tellStopped.return_value = []
+
+        data = self.client.get('/api/status', headers={'x-api-key': 'test-key'}).get_json()
+        self.assertEqual(data['active'][0]['files'], [{'path': '/x/Show/e01.mkv'}])
+        self.assertEqual(data['active'][0]['bittorrent'], {'info': {'name': 'Show'}})
+        self.assertEqual(data['waiting'][0]['bittorrent'], {})
+
+    def test_status_body_reused_within_cache_ttl(self):
+        mock_aria2.tellActive.return_value = [{'gid': 'a'}]
+        mock_aria2.tellWaiting.return_value = []
+        mock_aria2.tellStopped.return_value = []
+        headers = {'x-api-key': 'test-key'}
+
+        with patch('app.orjson.dumps', wraps=backend_module.orjson.dumps) as mock_dumps:
+            first = self.client.get('/api/status', headers=headers).data
+            second = self.client.get('/api/status', headers=headers).data
+        self.assertEqual(first, second)
+        self.assertEqual(mock_dumps.call_count, 1)
+
+    def test_unchanged_responses_return_304(self):
+        mock_aria2.tellActive.return_value = [{'gid': 'a'}]
+        mock_aria2.tellWaiting.return_value = []
+        mock_aria2.tellStopped.return_value = []
+        headers = {'x-api-key': 'test-key'}
+
+        for url in ('/api/status', '/api/logs'):
+            first = self.client.get(url, headers=headers)
+            etag = first.headers['ETag']
+            again = self.client.get(url, headers=dict(headers, **{'If-None-Match': etag}))
+            self.assertEqual(again.status_code, 304)
+            self.assertEqual(again.data, b'')
+
+        backend_module.log("info", "test", "changed")
+        changed = self.client.get('/api/logs', headers=dict(headers, **{'If-None-Match': etag}))
+        self.assertEqual(changed.status_code, 200)
+
+        # A restarted backend counts versions from 0 again; an old tag must not match
+        etag = self.client.get('/api/logs', headers=headers).headers['ETag']
+        with patch('app.BOOT_ID', 'restarted'):
+            restarted = self.client.get('/api/logs', headers=dict(headers, **{'If-None-Match': etag}))
+        self.assertEqual(restarted.status_code, 200)
+
+    def test_large_responses_are_gzipped(self):
+        import gzip
+        mock_aria2.tellActive.return_value = [{'gid': str(i), 'status': 'active'} for i in range(50)]
+        mock_aria2.tellWaiting.return_value = []
+        mock_aria2.tellStopped.return_value = []
+        headers = {'x-api-key': 'test-key'}
+
+        plain = self.client.get('/api/status', headers=headers)
+        packed = self.client.get('/api/status', headers=dict(headers, **{'Accept-Encoding': 'gzip'}))
+        self.assertIsNone(plain.content_encoding)
+        self.assertEqual(packed.content_encoding, 'gzip')
+        self.assertLess(len(packed.data), len(plain.data))
+        self.assertEqual(gzip.decompress(packed.data), plain.data)
+
+    @patch('shutil.disk_usage')
+    def test_drive_info_is_cached(self, mock_disk_usage):
+        mock_disk_usage.return_value = (100, 40, 60)
+        backend_module.drive_info_cache["body"] = None
+        headers = {'x-api-key': 'test-key'}
+
+        first = self.client.get('/api/drive/info', headers=headers).get_json()
+        second = self.client.get('/api/drive/info', headers=headers).get_json()
+        self.assertEqual(first, {"total": 100, "used": 40, "free": 60})
+        self.assertEqual(second, first)
+        self.assertEqual(mock_disk_usage.call_count, 1)
+
+        response = self.client.get('/api/drive/info', headers=headers)
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(int(response.headers['Content-Length']), len(response.data))
+
+    def test_remove_path_deletes_tree(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, 'Season')
+            os.mkdir(root)
+            os.mkdir(os.path.join(root, 'Subs'))
+            for rel in ('e01.mkv', 'Subs/e01.srt'):
+                with open(os.path.join(root, rel), 'w') as f:
+                    f.write('x')
+            single = os.path.join(tmp, 'movie.mkv')
+            with open(single, 'w') as f:
+                f.write('x')
+
+            backend_module.remove_path(root)
+            backend_module.remove_path(single)
+            self.assertEqual(os.listdir(tmp), [])
+
+    @patch('app.move_path')
+    def test_finished_metadata_is_not_moved(self, mock_move):
+        # aria2 reports a finished magnet metadata download with a relative placeholder path
+        mover = BackgroundMonitor()
+        task = {'gid': 'meta', 'status': 'complete', 'totalLength': '0', 'files': [{'path': '[METADATA]abc123'}]}
+        mock_aria2.tellActive.return_value = []
+        mock_aria2.tellWaiting.return_value = []
+        mock_aria2.tellStopped.return_value = [task]
+        mock_aria2.tellStatus.return_value = task
+
+        mover.check_downloads()
+        mover.moves.shutdown(wait=True)
+
+        mock_move.assert_not_called()
+        mock_aria2.removeDownloadResult.assert_called_once_with('meta')
+        self.assertNotIn('meta', backend_module.uploading_tasks)
+
+    def test_move_path_refuses_to_move_into_itself(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            staging = os.path.join(tmp, 'temp_downloads')
+            os.mkdir(staging)
+            with open(os.path.join(tmp, 'keep.txt'), 'w') as f:
+                f.write('x')
+
+            with patch('os.rename', side_effect=OSError(errno.EXDEV, 'cross-device link')):
+                with self.assertRaises(backend_module.shutil.Error):
+                    backend_module.move_path(os.path.join(staging, '..'), os.path.join(staging, 'Drive'), True)
+            self.assertTrue(os.path.exists(os.path.join(tmp, 'keep.txt')))
+
+    def test_move_path_copies_across_filesystems(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, 'MyMovie')
+            os.mkdir(src)
+            os.mkdir(os.path.join(src, 'Subs'))
+            payload = os.urandom(3 * 1024 * 1024 + 17)
+            with open(os.path.join(src, 'movie.mkv'), 'wb') as f:
+                f.write(payload)
+            with open(os.path.join(src, 'Subs', 'movie.srt'), 'w') as f:
+                f.write('subs')
+            dst = os.path.join(tmp, 'Drive')
+
+            # Force the cross-device path even though both live in the same temp dir
+            copied = []
+            with patch('os.rename', side_effect=OSError(errno.EXDEV, 'cross-device link')):
+                backend_module.move_path(src, dst, progress=copied.append)
+
+            self.assertFalse(os.path.exists(src))
+            with open(os.path.join(dst, 'movie.mkv'), 'rb') as f:
+                self.assertEqual(f.read(), payload)
+            with open(os.path.join(dst, 'Subs', 'movie.srt')) as f:
+                self.assertEqual(f.read(), 'subs')
+            self.assertEqual(sum(copied), len(payload) + 4)
+
+            # A single-file torrent reports progress as it copies too
+            movie = os.path.join(dst, 'movie.mkv')
+            copied = []
+            with patch('os.rename', side_effect=OSError(errno.EXDEV, 'cross-device link')):
+                backend_module.move_path(movie, os.path.join(tmp, 'movie.mkv'), False, progress=copied.append)
+            self.assertEqual(sum(copied), len(payload))
+
+    def test_copy_tree_stops_after_a_failed_copy(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, 'Pack')
+            os.mkdir(src)
+            for i in range(6):
+                with open(os.path.join(src, f'{i}.srt'), 'w') as f:
+                    f.write('x')
+
+            with patch('app.COPY_QUEUE_DEPTH', 1), \
+                    patch('app.copy_file', side_effect=OSError(errno.EIO, 'i/o error')) as mock_copy:
+                with self.assertRaises(OSError):
+                    backend_module.copy_tree(src, os.path.join(tmp, 'Drive'))
+            self.assertLess(mock_copy.call_count, 6)
+
+    def test_copy_file_falls_back_when_copy_file_range_fails(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, 'movie.mkv')
+            dst = os.path.join(tmp, 'copy.mkv')
+            payload = os.urandom(5 * 1024 * 1024 + 3)
+            with open(src, 'wb') as f:
+                f.write(payload)
+
+            no_reflink = patch('fcntl.ioctl', side_effect=OSError(errno.EOPNOTSUPP, 'operation not supported'))
+            copied = []
+            with no_reflink, patch('os.copy_file_range', side_effect=OSError(errno.EXDEV, 'cross-device link'), create=True):
+                backend_module.copy_file(src, dst, copied.append)
+            with open(dst, 'rb') as f:
+                self.assertEqual(f.read(), payload)
+            # Progress is reported chunk by chunk, not once at the end
+            self.assertGreater(len(copied), 1)
+            self.assertEqual(sum(copied), len(payload))
+
+            # And with neither in-kernel copy available, through the buffered loop
+            with no_reflink, patch('os.copy_file_range', side_effect=OSError(errno.EXDEV, 'cross-device link'), create=True), \
+                    patch('os.sendfile', side_effect=OSError(errno.EINVAL, 'invalid argument'), create=True):
+                copied = []
+                backend_module.copy_file(src, dst, copied.append)
+            with open(dst, 'rb') as f:
+                self.assertEqual(f.read(), payload)
+            self.assertEqual(sum(copied), len(payload))
+            # copy_file_range failing partway through: sendfile must carry on from the same offset
+            def one_chunk_then_eio(fd_in, fd_out, count, offset_src, offset_dst):
+                if offset_src:
+                    raise OSError(errno.EIO, 'i/o error')
+                return os.pwrite(fd_out, os.pread(fd_in, count, offset_src), offset_dst)
+            with no_reflink, patch('os.copy_file_range', side_effect=one_chunk_then_eio, create=True):
+                backend_module.copy_file(src, dst)
+            with open(dst, 'rb') as f:
+                self.assertEqual(f.read(), payload)
+
+            # The fallback buffer is kept for the thread's next copy
+            self.assertIs(backend_module.copy_buffer(), backend_module.copy_buffer())
+
+    def test_copy_file_clones_when_reflink_is_supported(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, 'movie.mkv')
+            dst = os.path.join(tmp, 'copy.mkv')
+            with open(src, 'wb') as f:
+                f.write(b'data')
+
+            with patch('fcntl.ioctl') as ioctl, patch('os.copy_file_range', create=True) as copy_range:
+                backend_module.copy_file(src, dst)
+            self.assertEqual(ioctl.call_args[0][1], backend_module.FICLONE)
+            copy_range.assert_not_called()
+
+    def test_iso_timestamp_matches_datetime_format(self):
+        from datetime import datetime
+        stamp = backend_module.iso_timestamp()
+        parsed = datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%S.%f")
+        self.assertLess(abs((datetime.now() - parsed).total_seconds()), 5)
+
+    def test_log_writer_buffers_until_flush(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'logs.json')
+            writer = backend_module.LogWriter(path)
+            writer.submit(b'{"a": 1}\n')
+            writer.submit(b'{"b": 2}\n')
+            self.assertFalse(os.path.exists(path))
+
+            writer.flush()
+            writer.submit(b'{"c": 3}\n', urgent=True)
+            os.close(writer.fd)
+
+            with open(path) as f:
+                self.assertEqual(f.read().splitlines(), ['{"a": 1}', '{"b": 2}', '{"c": 3}'])
+
+    def test_log_writer_compacts_oversized_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'logs.json')
+            writer = backend_module.LogWriter(path, max_size=200)
+            lines = [b'{"n": %d}\n' % i for i in range(30)]
+            for line in lines:
+                writer.submit(line, urgent=True)
+
+            self.assertLessEqual(os.path.getsize(path), 200)
+            kept = backend_module.read_tail(path, 1024)
+            # Only whole lines survive, and they are the newest ones
+            self.assertTrue(kept)
+            self.assertEqual(kept, [line.rstrip(b'\n') for line in lines[-len(kept):]])
+            if writer.fd is not None:
+                os.close(writer.fd)
 
 if __name__ == '__main__':
     unittest.main()